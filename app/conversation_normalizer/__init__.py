@@ -19,8 +19,10 @@ Role classification uses simple heuristics + turn ordering:
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import List, Optional
+import sys
+from typing import Iterable, Iterator, List, Optional
 from loguru import logger
 
 from app.schemas import ConversationTurn, Role
@@ -29,22 +31,23 @@ from app.speech_pipeline.schemas import SpeechSegment
 
 # ── Role assignment ───────────────────────────────────────────────────────────
 
-_SPEAKER_ROLE_MAP: dict[str, Role] = {}   # populated dynamically per call
+# Enum members resolved once at import; the normalizer loops use these
+# instead of going through Role's metaclass attribute lookup every turn.
+_R_AGENT    = Role.agent
+_R_CUSTOMER = Role.customer
+
+# Unlabeled transcripts alternate speakers: index parity (i & 1) → role / id
+_ALT_ROLE = (_R_AGENT, _R_CUSTOMER)
+_ALT_SID  = ("AGENT", "CUSTOMER")
+
 
 def _assign_roles_from_speakers(segments: List[SpeechSegment]) -> dict[str, Role]:
     """
     In a banking support call the first speaker is typically the agent.
-    Map SPEAKER_00 → agent, all others → customer.
+    Seed the map with first speaker → agent; every other speaker defaults
+    to customer as it is first seen (see normalize_from_speech).
     """
-    speakers_seen: list[str] = []
-    for seg in segments:
-        if seg.speaker_id not in speakers_seen:
-            speakers_seen.append(seg.speaker_id)
-
-    role_map: dict[str, Role] = {}
-    for i, spk in enumerate(speakers_seen):
-        role_map[spk] = Role.agent if i == 0 else Role.customer
-    return role_map
+    return {sys.intern(segments[0].speaker_id): _R_AGENT}
 
 
 # ── Audio path normalizer ─────────────────────────────────────────────────────
@@ -70,39 +73,169 @@ def normalize_from_speech(
         return []
 
     role_map = _assign_roles_from_speakers(segments)
-    turns: List[ConversationTurn] = []
 
-    for seg in segments:
-        role = role_map.get(seg.speaker_id, Role.unknown)
+    # Build the whole timeline in one pass through a pre-resolved
+    # constructor. Plain __init__ is used rather than model_construct:
+    # Pydantic v2 validates in Rust, which beats the pure-Python
+    # model_construct path for these simple fields.
+    # Speakers not yet in role_map are recorded as customers on first sight.
+    # Speaker ids are interned so every turn shares one string per speaker
+    # and role_map lookups hit the identity fast path.
+    _Turn = ConversationTurn
+    _role = role_map.setdefault
+
+    # For multilingual support: English stays as-is;
+    # non-English text is kept in original — LLM handles translation context
+    # TODO: plug in translation for normalized_text_en if needed
+    turns: List[ConversationTurn] = [
+        _Turn(
+            speaker_id=sid,
+            role=_role(sid, _R_CUSTOMER),
+            original_text=s.original_text,
+            normalized_text_en=s.original_text,
+            language=s.language,
+            emotion=s.emotion,
+            start_time=s.start_time,
+            end_time=s.end_time,
+        )
+        for s in segments
+        for sid in (sys.intern(s.speaker_id),)
+    ]
+
+    logger.opt(lazy=True).info(
+        "[Normalizer] Audio → {} turns | speakers: {} | roles: {}",
+        lambda: len(turns),
+        lambda: set(role_map),
+        lambda: set(role_map.values()),
+    )
+    return turns
+
 
-        # For multilingual support: English stays as-is;
-        # non-English text is kept in original — LLM handles translation context
-        normalized_en = seg.original_text  # TODO: plug in translation if needed
+# ── Text path normalizer ──────────────────────────────────────────────────────
 
-        turns.append(ConversationTurn(
-            speaker_id=seg.speaker_id,
-            role=role,
-            original_text=seg.original_text,
-            normalized_text_en=normalized_en,
-            language=seg.language,
-            emotion=seg.emotion,
-            start_time=seg.start_time,
-            end_time=seg.end_time,
-        ))
+# Single anchored alternation: one match() per line decides the role
+# (via lastgroup) and m.end() gives the slice point for the utterance.
+_PREFIX_RE = re.compile(
+    r"^(?:(?P<agent>Agent|Support|CSR|Representative)"
+    r"|(?P<customer>Customer|Client|User|Caller)"
+    r"|(?P<spk>SPEAKER_\d+))\s*[:\-]\s*",
+    re.I,
+)
+_prefix_match = _PREFIX_RE.match
 
-    logger.info(
-        f"[Normalizer] Audio → {len(turns)} turns | "
-        f"speakers: {set(role_map.keys())} | "
-        f"roles: {set(role_map.values())}"
+
+def _text_turn_factory(language: str):
+    """
+    ConversationTurn constructor with the fields shared by every text turn
+    frozen in, so the per-line call only passes what was parsed.
+    """
+    return functools.partial(
+        ConversationTurn,
+        language=language,
+        emotion=None,
+        start_time=None,
+        end_time=None,
     )
-    return turns
 
 
-# ── Text path normalizer ──────────────────────────────────────────────────────
+def _split_lines(transcript: str) -> Iterator[str]:
+    """Lazily strip every line once and drop blanks."""
+    return (s for l in transcript.splitlines() if (s := l.strip()))
+
+
+def _iter_parse_lines(
+    lines: Iterable[str],
+    make_turn,
+    agent_role: Role,
+    customer_role: Role,
+    prefix_match,
+) -> Iterator[ConversationTurn]:
+    """
+    Core per-line loop shared by all text normalizers; yields one turn
+    per non-empty utterance.
+
+    Hot-loop lookups (turn constructor, role members, prefix matcher) are
+    passed in pre-resolved so callers can hoist them once per batch.
+    `make_turn` must already carry the fields shared by every text turn
+    (see _text_turn_factory); only the per-line fields are passed here.
+    """
+    # Raw "SPEAKER_xx" label → (canonical speaker_id, role); a transcript
+    # only has a handful, so each is upper-cased and classified once.
+    speakers: dict[str, tuple[str, Role]] = {}
+
+    for i, line in enumerate(lines):
+        # Detect role from prefix
+        text = line
+
+        if m := prefix_match(line):
+            text = line[m.end():]
+            kind = m.lastgroup
+            if kind == "agent":
+                role = agent_role
+                speaker_id = "AGENT"
+            elif kind == "customer":
+                role = customer_role
+                speaker_id = "CUSTOMER"
+            else:
+                spk = m.group("spk")
+                if (known := speakers.get(spk)) is None:
+                    sid = sys.intern(spk.upper())
+                    # SPEAKER_00 → agent, rest → customer
+                    known = speakers[spk] = (
+                        sid, agent_role if sid == "SPEAKER_00" else customer_role,
+                    )
+                speaker_id, role = known
+        else:
+            # Plain alternating: even index → agent, odd → customer
+            parity = i & 1
+            role = _ALT_ROLE[parity]
+            speaker_id = _ALT_SID[parity]
+
+        if not text:
+            continue
+
+        yield make_turn(
+            speaker_id=speaker_id,
+            role=role,
+            original_text=text,
+            normalized_text_en=text,
+        )
+
+
+def iter_normalize_from_text(
+    transcript: str,
+    language: str = "en",
+) -> Iterator[ConversationTurn]:
+    """
+    Streaming variant of normalize_from_text(): yields ConversationTurns
+    one at a time so consumers that render or forward turns as they go
+    never hold the whole timeline in memory.
 
-_AGENT_PREFIX    = re.compile(r"^(Agent|AGENT|Support|CSR|Representative)\s*[:\-]\s*", re.I)
-_CUSTOMER_PREFIX = re.compile(r"^(Customer|CUSTOMER|Client|User|Caller)\s*[:\-]\s*", re.I)
-_SPEAKER_PREFIX  = re.compile(r"^(SPEAKER_\d+)\s*[:\-]\s*", re.I)
+    Parameters
+    ----------
+    transcript : str
+        Raw multi-line conversation text.
+    language : str
+        Language code for the transcript (default: "en").
+
+    Yields
+    ------
+    ConversationTurn
+    """
+    n = 0
+    for n, turn in enumerate(
+        _iter_parse_lines(
+            _split_lines(transcript),
+            _text_turn_factory(language),
+            _R_AGENT,
+            _R_CUSTOMER,
+            _prefix_match,
+        ),
+        1,
+    ):
+        yield turn
+
+    logger.info("[Normalizer] Text → {} turns | lang={}", n, language)
 
 
 def normalize_from_text(
@@ -128,62 +261,66 @@ def normalize_from_text(
     -------
     List[ConversationTurn]
     """
-    lines = [l.strip() for l in transcript.strip().splitlines() if l.strip()]
-    turns: List[ConversationTurn] = []
+    return list(iter_normalize_from_text(transcript, language))
 
-    for i, line in enumerate(lines):
-        # Detect role from prefix
-        role = Role.unknown
-        text = line
 
-        if _AGENT_PREFIX.match(line):
-            role = Role.agent
-            text = _AGENT_PREFIX.sub("", line).strip()
-            speaker_id = "AGENT"
-        elif _CUSTOMER_PREFIX.match(line):
-            role = Role.customer
-            text = _CUSTOMER_PREFIX.sub("", line).strip()
-            speaker_id = "CUSTOMER"
-        elif m := _SPEAKER_PREFIX.match(line):
-            speaker_id = m.group(1).upper()
-            text = _SPEAKER_PREFIX.sub("", line).strip()
-            # SPEAKER_00 → agent, rest → customer
-            role = Role.agent if speaker_id == "SPEAKER_00" else Role.customer
-        else:
-            # Plain alternating: even index → agent, odd → customer
-            role = Role.agent if i % 2 == 0 else Role.customer
-            speaker_id = "AGENT" if role == Role.agent else "CUSTOMER"
+def normalize_from_text_batch(
+    transcripts: List[str],
+    language: str = "en",
+) -> List[List[ConversationTurn]]:
+    """
+    Normalize many raw text transcripts in one call.
 
-        if not text:
-            continue
+    Equivalent to calling normalize_from_text() on each transcript, but
+    the turn constructor is built once and a single summary is logged
+    for the whole batch.
 
-        turns.append(ConversationTurn(
-            speaker_id=speaker_id,
-            role=role,
-            original_text=text,
-            normalized_text_en=text,
-            language=language,
-            emotion=None,
-            start_time=None,
-            end_time=None,
+    Parameters
+    ----------
+    transcripts : List[str]
+        Raw multi-line conversation texts.
+    language : str
+        Language code shared by all transcripts (default: "en").
+
+    Returns
+    -------
+    List[List[ConversationTurn]]
+        One turn list per input transcript, in input order.
+    """
+    make_turn = _text_turn_factory(language)
+
+    results = [
+        list(_iter_parse_lines(
+            _split_lines(t), make_turn, _R_AGENT, _R_CUSTOMER, _prefix_match,
         ))
+        for t in transcripts
+    ]
 
     logger.info(
-        f"[Normalizer] Text → {len(turns)} turns | lang={language}"
+        "[Normalizer] Text batch → {} transcripts | {} turns | lang={}",
+        len(results),
+        sum(map(len, results)),
+        language,
     )
-    return turns
+    return results
 
 
 # ── Convenience: full text of conversation for LLM ───────────────────────────
 
-def turns_to_dialogue_string(turns: List[ConversationTurn]) -> str:
+_ROLE_LABEL: dict[Role, str] = {r: r.value.capitalize() for r in Role}
+
+
+def turns_to_dialogue_string(turns: Iterable[ConversationTurn]) -> str:
     """
-    Render ConversationTurn list as a readable dialogue string
+    Render ConversationTurns as a readable dialogue string
     for feeding into the LLM prompt.
+
+    Accepts any iterable, so iter_normalize_from_text() output can be
+    streamed straight in without materializing the turn list.
     """
-    lines = []
-    for t in turns:
-        role_label = t.role.value.capitalize()
-        emotion_tag = f" [{t.emotion}]" if t.emotion else ""
-        lines.append(f"{role_label}{emotion_tag}: {t.normalized_text_en}")
-    return "\n".join(lines)
+    label = _ROLE_LABEL
+    return "\n".join(
+        f"{label[t.role]} [{t.emotion}]: {t.normalized_text_en}" if t.emotion
+        else f"{label[t.role]}: {t.normalized_text_en}"
+        for t in turns
+    )